@@ -1,50 +1,57 @@
-import requests, hashlib, hmac, os, json
+import requests, hashlib, hmac, os
+import orjson
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 from ..schemas.api import AnalyzeRequest
 from ..router.rule_router import RouteDecision
-from ..utils.normalize import normalize_to_dataframe
 
-SECRET = b"demo-secret"
+# environment is snapshotted at import, not re-read per tool call
+SECRET = os.getenv("TOOL_HMAC_SECRET", "demo-secret").encode("utf-8")
+TIMEOUT = float(os.getenv("TOOL_TIMEOUT_SECONDS", "30"))
+# per-host keep-alive pool; size it to the number of concurrent analyze calls
+POOL_SIZE = int(os.getenv("DISPATCHER_POOL_SIZE", "32"))
 
 class Dispatcher:
     def __init__(self, registry):
         self.registry = registry
+        # reuse keep-alive connections to tool services across requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # protocol -> sender; gRPC/Kafka transports plug in here
+        self._transports = {"REST": self._send_rest}
 
     def invoke(self, decision: RouteDecision, req: AnalyzeRequest) -> Dict[str, Any]:
+        send = self._transports.get(decision.protocol)
+        if send is None:
+            raise NotImplementedError("Only REST is wired in the skeleton.")
+
         payload = {
             "input": self._make_input(req),
             "params": req.params,
             "context": {"tenant_id": req.tenant_id, "task": req.context.get("task"), "trace_id": decision.trace_id}
         }
-        # sign HMAC for internal calls
-        body = json.dumps(payload).encode("utf-8")
+        # sign HMAC for internal calls; the signed bytes are the bytes we send
+        body = orjson.dumps(payload)
         sig = hmac.new(SECRET, body, hashlib.sha256).hexdigest()
+        return send(decision.endpoint, body, sig)
 
-        if decision.protocol == "REST":
-            r = requests.post(decision.endpoint, json=payload, headers={"X-Signature": sig}, timeout=30)
-            r.raise_for_status()
-            return r.json()
-        else:
-            raise NotImplementedError("Only REST is wired in the skeleton.")
+    def _send_rest(self, endpoint: str, body: bytes, sig: str) -> Dict[str, Any]:
+        headers = {"Content-Type": "application/json", "X-Signature": sig}
+        r = self.session.post(endpoint, data=body, headers=headers, timeout=TIMEOUT)
+        r.raise_for_status()
+        return orjson.loads(r.content)
 
     def _make_input(self, req: AnalyzeRequest) -> Dict[str, Any]:
+        params = req.params
+        schema = {
+            "timestamp": params.get("timestamp_field","timestamp"),
+            "entity_keys": params.get("key_fields",["segment_id"]),
+            "metric": params.get("metric","speed_kmh")
+        }
         if req.data_pointer.format == "inline" and req.data_pointer.rows:
             # inline path for demo
-            return {
-                "frame_uri": "inline://rows",
-                "rows": req.data_pointer.rows,
-                "schema": {
-                    "timestamp": req.params.get("timestamp_field","timestamp"),
-                    "entity_keys": req.params.get("key_fields",["segment_id"]),
-                    "metric": req.params.get("metric","speed_kmh")
-                }
-            }
+            return {"frame_uri": "inline://rows", "rows": req.data_pointer.rows, "schema": schema}
         # otherwise pass through the pointer (parquet/csv/etc.)
-        return {
-            "frame_uri": req.data_pointer.uri,
-            "schema": {
-                "timestamp": req.params.get("timestamp_field","timestamp"),
-                "entity_keys": req.params.get("key_fields",["segment_id"]),
-                "metric": req.params.get("metric","speed_kmh")
-            }
-        }
+        return {"frame_uri": req.data_pointer.uri, "schema": schema}
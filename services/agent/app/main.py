@@ -1,5 +1,13 @@
-from fastapi import FastAPI, Body, HTTPException, Header
+import asyncio
+import os
+import time
+import orjson
+import requests
+from typing import Any, Dict, List
+from fastapi import FastAPI, Body, HTTPException, Header, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from .schemas.api import AnalyzeRequest, AnalyzeResponse, RunResponse
 from .router.rule_router import RuleRouter
@@ -7,9 +15,10 @@ from .dispatcher.dispatcher import Dispatcher
 from .registry.registry import ToolRegistry
 from .security.auth import verify_jwt_stub
 from .observability.otel import init_tracing
+from .observability.profiling import install_profiler
 
 
-app = FastAPI(title="MCP Agent", version="v1")
+app = FastAPI(title="MCP Agent", version="v1", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -17,38 +26,92 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+install_profiler(app)
 
 tool_registry = ToolRegistry()
 router = RuleRouter(tool_registry)
 dispatcher = Dispatcher(tool_registry)
 
+# static bodies, encoded once
+_HEALTH_BYTES = b'{"status":"healthy","version":"v1"}'
+_TOOLS_BYTES = orjson.dumps(tool_registry.list_tools())
+
+# cap per batch so one caller cannot occupy the whole threadpool and starve /v1/analyze
+BATCH_MAX_ITEMS = int(os.getenv("ANALYZE_BATCH_MAX_ITEMS", "16"))
+
 init_tracing(service_name="mcp-agent")
 
-@app.post("/v1/analyze", response_model=AnalyzeResponse)
-def analyze(req: AnalyzeRequest, authorization: str | None = Header(default=None)):
+def _route(req: AnalyzeRequest):
+    decision = router.route(req)
+    if not decision.tool:
+        raise HTTPException(status_code=400, detail="No matching tool for request")
+    return decision
+
+def _response(decision, status: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    # plain dict shaped like AnalyzeResponse
+    return {
+        "request_id": decision.request_id,
+        "status": status,
+        "result": result,
+        "tool_meta": {"invoked":[f"{decision.tool}@{decision.version}"], "trace_id": decision.trace_id}
+    }
+
+async def _dispatch(decision, req: AnalyzeRequest) -> Dict[str, Any]:
+    # dispatch (sync path); the tool call is blocking HTTP, so keep it off the event loop
+    result = await run_in_threadpool(dispatcher.invoke, decision, req)
+    # model_dump only runs if an INFO sink will actually emit the record
+    logger.opt(lazy=True).info("Decision={}", decision.model_dump)
+    return _response(decision, "ok", result.get("output", {}))
+
+@app.post("/v1/analyze", responses={200: {"model": AnalyzeResponse}})
+async def analyze(req: AnalyzeRequest, authorization: str | None = Header(default=None)):
     # auth (stub)
     verify_jwt_stub(authorization)
 
     # route
-    decision = router.route(req)
-    if not decision.tool:
-        raise HTTPException(status_code=400, detail="No matching tool for request")
+    t0 = time.monotonic_ns()
+    decision = _route(req)
+    t1 = time.monotonic_ns()
+    result = await _dispatch(decision, req)
+    t2 = time.monotonic_ns()
+    # per-step breakdown shows up in the browser devtools timing tab
+    timing = f"route;dur={(t1 - t0) / 1e6:.3f}, tool;dur={(t2 - t1) / 1e6:.3f}"
+    return ORJSONResponse(result, headers={"Server-Timing": timing})
+
+@app.post("/v1/analyze:batch", responses={200: {"model": List[AnalyzeResponse]}})
+async def analyze_batch(reqs: List[AnalyzeRequest], authorization: str | None = Header(default=None)):
+    # one auth check and one HTTP round-trip for the whole batch
+    verify_jwt_stub(authorization)
+    if len(reqs) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {BATCH_MAX_ITEMS} items")
+
+    # route everything first so an unroutable item fails the batch before any tool runs
+    decisions = [_route(req) for req in reqs]
+    # tool calls for the batch run concurrently; a failed tool call only fails its own item
+    outcomes = await asyncio.gather(*(_dispatch(d, req) for d, req in zip(decisions, reqs)), return_exceptions=True)
+    results = []
+    for decision, outcome in zip(decisions, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning("Batch item {} failed: {!r}", decision.request_id, outcome)
+            # fixed message only; the exception text carries internal tool URLs
+            error = {"error": "tool invocation failed"}
+            if isinstance(outcome, requests.HTTPError) and outcome.response is not None:
+                error["upstream_status"] = outcome.response.status_code
+            outcome = _response(decision, "error", error)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        results.append(outcome)
+    return ORJSONResponse(results)
 
-    # dispatch (sync path)
-    result = dispatcher.invoke(decision, req)
-    logger.info(f"Decision={decision.model_dump()}")
-    return AnalyzeResponse(
-        request_id=decision.request_id,
-        status="ok",
-        result=result.get("output", {}),
-        tool_meta={"invoked":[f"{decision.tool}@{decision.version}"], "trace_id": decision.trace_id}
-    )
+@app.get("/health")
+async def health():
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 @app.get("/v1/tools")
-def list_tools():
-    return tool_registry.list_tools()
+async def list_tools():
+    return Response(content=_TOOLS_BYTES, media_type="application/json")
 
 @app.get("/v1/runs/{run_id}", response_model=RunResponse)
-def get_run(run_id: str):
+async def get_run(run_id: str):
     # stub for now
     return RunResponse(run_id=run_id, status="SUCCEEDED", steps=[])
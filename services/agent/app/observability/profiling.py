@@ -0,0 +1,30 @@
+import os
+from loguru import logger
+
+def install_profiler(app) -> bool:
+    # On-demand profiling: with PROFILING set, append ?profile=1 to any request to
+    # get a pyinstrument HTML report instead of the normal response. Unset, no
+    # middleware is mounted at all, so production pays nothing.
+    if not os.getenv("PROFILING"):
+        return False
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        logger.warning("PROFILING is set but pyinstrument is not installed; profiler disabled")
+        return False
+    from fastapi.responses import HTMLResponse
+
+    @app.middleware("http")
+    async def profile_request(request, call_next):
+        if request.query_params.get("profile") not in ("1", "true"):
+            return await call_next(request)
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        profiler.start()
+        try:
+            await call_next(request)
+        finally:
+            # always detach the sampler, even if the handler raised
+            profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+    return True
@@ -1,16 +1,23 @@
-import json, os
-from typing import Dict, Any, List
+import json, os, sys
+from typing import Dict, Any, Tuple
 
-# TOOLS_PATH = os.getenv("TOOL_REGISTRY_PATH", "/app/registry/tools.json")
-TOOLS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../registry/tools.json'))
+# environment is read once at import; falls back to the repo copy for local runs
+TOOLS_PATH = os.getenv("TOOL_REGISTRY_PATH") or os.path.abspath(os.path.join(os.path.dirname(__file__), '../../registry/tools.json'))
 
 class ToolRegistry:
+    # Loaded once from tools.json and never mutated afterwards; the listing here,
+    # the router's endpoint table and the agent's /v1/tools body all rely on that.
     def __init__(self):
         with open(TOOLS_PATH, "r") as f:
-            self.tools = {t["name"]: t for t in json.load(f)}
+            tools = json.load(f)
+        for t in tools:
+            # share one string object with the router's tool-name literals
+            t["name"] = sys.intern(t["name"])
+        self.tools = {t["name"]: t for t in tools}
+        self._listing = tuple(self.tools.values())
 
-    def list_tools(self) -> List[Dict[str, Any]]:
-        return list(self.tools.values())
+    def list_tools(self) -> Tuple[Dict[str, Any], ...]:
+        return self._listing
 
     def get_tool(self, name: str) -> Dict[str, Any] | None:
         return self.tools.get(name)
@@ -1,10 +1,13 @@
-import uuid, time
-from pydantic import BaseModel
+import secrets
+from types import MappingProxyType
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from ..schemas.api import AnalyzeRequest
 from ..registry.registry import ToolRegistry
 
 class RouteDecision(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     request_id: str
     trace_id: str
     tool: Optional[str] = None
@@ -12,47 +15,48 @@ class RouteDecision(BaseModel):
     protocol: str = "REST"
     endpoint: Optional[str] = None
 
+# (task, accepted data types, tool) -- flattened once into _RULES below
+ROUTING_RULES = (
+    ("anomaly_detection", ("tabular", "timeseries"), "anomaly_zscore"),
+    ("clustering", ("tabular",), "clustering"),
+    ("feature_engineering", ("tabular",), "feature_engineering"),
+    ("classification", ("tabular",), "classifier_regressor"),
+    ("forecasting", ("timeseries",), "timeseries_forecaster"),
+    ("stats_comparison", ("tabular",), "stats_comparator"),
+    ("incident_detection", ("tabular",), "incident_detector"),
+)
+_RULES = MappingProxyType({(task, dt): tool for task, dts, tool in ROUTING_RULES for dt in dts})
+
 class RuleRouter:
+    __slots__ = ("registry", "_rules", "_targets")
+
     def __init__(self, registry: ToolRegistry):
         self.registry = registry
+        # (task, data_type) -> tool name
+        self._rules = _RULES
+        # tool name -> (REST endpoint, version)
+        self._targets = MappingProxyType({t["name"]: (t["endpoints"].get("REST"), t["version"]) for t in registry.list_tools()})
 
     def route(self, req: AnalyzeRequest) -> RouteDecision:
-        rid = str(uuid.uuid4())[:8]
-        tid = str(uuid.uuid4())[:8]
+        rid = secrets.token_hex(12)
+        tid = secrets.token_hex(12)
         task = (req.context or {}).get("task","").lower()
         data_type = (req.context or {}).get("data_type","").lower()
 
         # Try to infer columns/features from inline data
-        columns = set()
-        if req.data_pointer.format == "inline" and req.data_pointer.rows:
-            first_row = req.data_pointer.rows[0] if len(req.data_pointer.rows) > 0 else {}
-            columns = set(first_row.keys())
+        # (dict key membership on the first row; no need to copy its keys into a set)
+        rows = req.data_pointer.rows
+        first_row = rows[0] if req.data_pointer.format == "inline" and rows else {}
 
-        tool = None
         # Rule-based logic
-        if "latitude" in columns and "longitude" in columns:
+        if "latitude" in first_row and "longitude" in first_row:
             tool = "geospatial_mapper"
-        elif task == "anomaly_detection" and data_type in ("tabular","timeseries"):
-            tool = "anomaly_zscore"
-        elif task == "clustering" and data_type == "tabular":
-            tool = "clustering"
-        elif task == "feature_engineering" and data_type == "tabular":
-            tool = "feature_engineering"
-        elif task == "classification" and data_type == "tabular":
-            tool = "classifier_regressor"
-        elif task == "forecasting" and data_type == "timeseries":
-            tool = "timeseries_forecaster"
-        elif task == "stats_comparison" and data_type == "tabular":
-            tool = "stats_comparator"
-        elif task == "incident_detection" and data_type == "tabular":
-            tool = "incident_detector"
+        else:
+            tool = self._rules.get((task, data_type))
 
         endpoint, version, protocol = None, "1.0.0", "REST"
-        if tool:
-            t = self.registry.get_tool(tool)
-            if t:
-                protocol = "REST"
-                endpoint = t["endpoints"].get(protocol)
-                version = t["version"]
-
-        return RouteDecision(request_id=rid, trace_id=tid, tool=tool, version=version, protocol=protocol, endpoint=endpoint)
+        if tool in self._targets:
+            endpoint, version = self._targets[tool]
+
+        # every field is produced here, so skip re-validating them
+        return RouteDecision.model_construct(request_id=rid, trace_id=tid, tool=tool, version=version, protocol=protocol, endpoint=endpoint)
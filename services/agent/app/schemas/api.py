@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Any, Optional, List, Dict
+from pydantic import BaseModel
+from typing import Any, Optional, List, Dict, Literal
 
 class DataPointer(BaseModel):
     uri: str
@@ -8,7 +8,7 @@ class DataPointer(BaseModel):
 
 class AnalyzeRequest(BaseModel):
     tenant_id: str
-    mode: str = Field("sync", pattern="^(sync|async)$")
+    mode: Literal["sync", "async"] = "sync"
     context: Dict[str, Any]
     data_pointer: DataPointer
     params: Dict[str, Any] = {}
@@ -1,6 +1,7 @@
-import pandas as pd
 from typing import List, Dict, Any
 
 def normalize_to_dataframe(rows: List[Dict[str,Any]]):
+    # pandas is heavy; only pay for the import when a caller needs a frame
+    import pandas as pd
     df = pd.DataFrame(rows)
     return df
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Request, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import IsolationForest
 
@@ -36,29 +37,33 @@ def run(payload: Payload, request: Request):
     ts = payload.input.schema.timestamp
     metric = payload.input.schema.metric
     keys = payload.input.schema.entity_keys
+    contamination = payload.params.contamination
 
     df[ts] = pd.to_datetime(df[ts])
     df = df.sort_values(keys + [ts]).set_index(ts)
 
     results = []
-    for key_vals, g in df.groupby(keys):
-        g = g.copy()
+    # df is already sorted by keys, so groupby need not sort the groups again
+    grouped = df.groupby(keys, sort=False)
+    for key_vals, g in grouped:
         # Isolation Forest expects 2D array
         X = g[[metric]].values
-        clf = IsolationForest(contamination=payload.params.contamination, random_state=42)
-        preds = clf.fit_predict(X)
-        for idx, pred in enumerate(preds):
-            if pred == -1:
-                t = g.index[idx]
-                results.append({
-                    "entity": dict(zip(keys, key_vals if isinstance(key_vals, tuple) else (key_vals,))),
-                    "timestamp": t.isoformat(),
-                    "value": float(g.iloc[idx][metric]),
-                    "score": float(clf.decision_function([X[idx]])[0])
-                })
+        clf = IsolationForest(contamination=contamination, random_state=42)
+        # negative decision_function score == predicted anomaly
+        scores = clf.fit(X).decision_function(X)
+        entity = dict(zip(keys, key_vals if isinstance(key_vals, tuple) else (key_vals,)))
+        # positions of the flagged rows within the group
+        for idx in np.flatnonzero(scores < 0):
+            t = g.index[idx]
+            results.append({
+                "entity": entity,
+                "timestamp": t.isoformat(),
+                "value": float(X[idx, 0]),
+                "score": float(scores[idx])
+            })
 
     summary = {
-        "total_entities": int(df.groupby(keys).ngroups),
+        "total_entities": int(grouped.ngroups),
         "total_points": int(len(df)),
         "anomaly_count": int(len(results))
     }